@@ -2,6 +2,7 @@
 Code generating classes and functions.
 """
 
+import struct
 from dataclasses import dataclass
 from typing import Optional, SupportsBytes
 
@@ -63,7 +64,7 @@ class Initcode(Code):
 
         # PUSH2: length=<bytecode length>
         initcode.append(0x61)
-        initcode += code_length.to_bytes(length=2, byteorder="big")
+        initcode += struct.pack(">H", code_length)
         self.execution_gas += 3
 
         # PUSH1: offset=0
@@ -144,18 +145,10 @@ class CodeGasMeasure(Code):
         """
         Assemble the bytecode that measures gas usage.
         """
-        res = bytes()
-        res += bytes(
-            [
-                0x5A,  # GAS
-            ]
-        )
+        res = bytearray()
+        res.append(0x5A)  # GAS
         res += to_bytes(self.code)  # Execute code to measure its gas cost
-        res += bytes(
-            [
-                0x5A,  # GAS
-            ]
-        )
+        res.append(0x5A)  # GAS
         # We need to swap and pop for each extra stack item that remained from
         # the execution of the code
         res += (
@@ -181,7 +174,7 @@ class CodeGasMeasure(Code):
                 0x00,  # STOP
             ]
         )
-        self.bytecode = res
+        self.bytecode = bytes(res)
 
 
 @dataclass(kw_only=True)
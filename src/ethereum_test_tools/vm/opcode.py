@@ -13,14 +13,11 @@ def _get_int_size(n: int) -> int:
         # Negative numbers in the EVM are represented as two's complement
         # of 32 bytes
         return 32
-    byte_count = 0
-    while n:
-        byte_count += 1
-        n >>= 8
-    return byte_count
+    return (n.bit_length() + 7) // 8
 
 
 _push_opcodes_byte_list = [bytes([0x5F + x]) for x in range(33)]
+_push1_bytecode_list = [bytes([0x60, x]) for x in range(256)]
 
 
 class Opcode(bytes):
@@ -97,16 +94,17 @@ class Opcode(bytes):
         Hex-strings will automatically be converted to bytes.
 
         """
-        args: List[Union[int, bytes, str, "Opcode"]] = list(args_t)
-        pre_opcode_bytecode = bytes()
+        stack_args = args_t
+        pre_opcode_bytecode: List[bytes] = []
         data_portion = bytes()
 
         if self.data_portion_length > 0:
             # For opcodes with a data portion, the first argument is the data
             # and the rest of the arguments form the stack.
-            if len(args) == 0:
+            if len(args_t) == 0:
                 raise ValueError("Opcode with data portion requires at least one argument")
-            data = args.pop(0)
+            data = args_t[0]
+            stack_args = args_t[1:]
             if isinstance(data, bytes) or isinstance(data, str):
                 if isinstance(data, str):
                     if data.startswith("0x"):
@@ -124,15 +122,18 @@ class Opcode(bytes):
             else:
                 raise TypeError("Opcode data portion must be either an int or bytes/hex string")
 
-        # The rest of the arguments conform the stack.
-        while len(args) > 0:
-            data = args.pop()
+        # The rest of the arguments conform the stack, pushed in reverse order.
+        for data in reversed(stack_args):
             if isinstance(data, bytes) or isinstance(data, str):
                 if isinstance(data, str):
                     if data.startswith("0x"):
                         data = data[2:]
                     data = bytes.fromhex(data)
-                pre_opcode_bytecode += data
+                pre_opcode_bytecode.append(data)
+            elif isinstance(data, int) and 0 <= data < 256:
+                # Single byte constants are the most common case, so their
+                # PUSH1 encoding is precomputed.
+                pre_opcode_bytecode.append(_push1_bytecode_list[data])
             elif isinstance(data, int):
                 # We are going to push a constant to the stack.
                 signed = data < 0
@@ -144,17 +145,19 @@ class Opcode(bytes):
                     # reasons.
                     data_size = 1
 
-                pre_opcode_bytecode += _push_opcodes_byte_list[data_size]
-                pre_opcode_bytecode += data.to_bytes(
-                    length=data_size,
-                    byteorder="big",
-                    signed=signed,
+                pre_opcode_bytecode.append(_push_opcodes_byte_list[data_size])
+                pre_opcode_bytecode.append(
+                    data.to_bytes(
+                        length=data_size,
+                        byteorder="big",
+                        signed=signed,
+                    )
                 )
 
             else:
                 raise TypeError("Opcode stack data must be either an int or a bytes/hex string")
 
-        return pre_opcode_bytecode + self + data_portion
+        return b"".join(pre_opcode_bytecode) + self + data_portion
 
     def __len__(self) -> int:
         """
@@ -11,6 +11,7 @@ from ethereum_test_tools import (
     compute_create2_address,
     compute_create_address,
     to_address,
+    to_hash_bytes,
 )
 from ethereum_test_tools.vm.opcode import Opcodes as Op
 
@@ -22,7 +23,7 @@ Z_Y_INVALID_ENDIANNESS: Literal["little", "big"] = "little"
 Z_Y_VALID_ENDIANNESS: Literal["little", "big"] = "big"
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Blob:
     """
     Class representing a full blob.
@@ -46,15 +47,11 @@ class Blob:
         Returns a tuple of lists of blobs, kzg commitments formatted to be added to a network blob
         type transaction.
         """
-        blobs: List[bytes] = []
-        kzg_commitments: List[bytes] = []
-        kzg_proofs: List[bytes] = []
-
-        for blob in input_blobs:
-            blobs.append(blob.blob)
-            kzg_commitments.append(blob.kzg_commitment)
-            kzg_proofs.append(blob.kzg_proof)
-        return (blobs, kzg_commitments, kzg_proofs)
+        return (
+            [blob.blob for blob in input_blobs],
+            [blob.kzg_commitment for blob in input_blobs],
+            [blob.kzg_proof for blob in input_blobs],
+        )
 
 
 # Simple list of blob versioned hashes ranging from bytes32(1 to 4)
@@ -63,6 +60,13 @@ simple_blob_hashes: list[bytes] = add_kzg_version(
     Spec.BLOB_COMMITMENT_VERSION_KZG,
 )
 
+# List of blob versioned hashes of `to_hash_bytes(x)` for x in [0, MAX_BLOBS_PER_BLOCK], which
+# covers any valid blob count plus one. Tests slice it to the number of blobs they require.
+sequential_blob_hashes: list[bytes] = add_kzg_version(
+    [to_hash_bytes(x) for x in range(SpecHelpers.max_blobs_per_block() + 1)],
+    Spec.BLOB_COMMITMENT_VERSION_KZG,
+)
+
 # Random fixed list of blob versioned hashes
 random_blob_hashes = add_kzg_version(
     [
@@ -3,15 +3,9 @@ Pytest (plugin) definitions local to EIP-4844 tests.
 """
 import pytest
 
-from ethereum_test_tools import (
-    Block,
-    TestPrivateKey2,
-    Transaction,
-    add_kzg_version,
-    to_address,
-    to_hash_bytes,
-)
+from ethereum_test_tools import Block, TestPrivateKey2, Transaction, to_address
 
+from .common import sequential_blob_hashes
 from .spec import BlockHeaderBlobGasFields, Spec
 
 
@@ -55,10 +49,7 @@ def non_zero_blob_gas_used_genesis_block(
                 max_priority_fee_per_gas=0,
                 max_fee_per_blob_gas=Spec.get_blob_gasprice(excess_blob_gas=excess_blob_gas),
                 access_list=[],
-                blob_versioned_hashes=add_kzg_version(
-                    [to_hash_bytes(x) for x in range(parent_blobs)],
-                    Spec.BLOB_COMMITMENT_VERSION_KZG,
-                ),
+                blob_versioned_hashes=sequential_blob_hashes[:parent_blobs],
                 secret_key=TestPrivateKey2,
             )
         ]
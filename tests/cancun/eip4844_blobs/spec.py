@@ -2,6 +2,7 @@
 Defines EIP-4844 specification constants and functions.
 """
 from dataclasses import dataclass
+from functools import lru_cache
 from hashlib import sha256
 from typing import Optional
 
@@ -19,7 +20,7 @@ class ReferenceSpec:
 ref_spec_4844 = ReferenceSpec("EIPS/eip-4844.md", "f0eb6a364aaf5ccb43516fa2c269a54fb881ecfd")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BlockHeaderBlobGasFields:
     """
     A helper class for the blob gas fields in a block header.
@@ -78,17 +79,33 @@ class Spec:
         return blob_commitment_version_kzg + sha256(kzg_commitment).digest()[1:]
 
     @classmethod
+    @lru_cache(maxsize=None)
     def fake_exponential(cls, factor: int, numerator: int, denominator: int) -> int:
         """
         Used to calculate the blob gas cost.
+
+        Results are memoized, since the same excess blob gas values are
+        repeatedly used across the parametrized test cases.
         """
-        i = 1
-        output = 0
-        numerator_accumulator = factor * denominator
+        output = factor * denominator
+        # First term of the series, `(factor * denominator * numerator) // denominator`.
+        numerator_accumulator = factor * numerator
+        # Running value of `denominator * i`, so each iteration only needs one division.
+        denominator_i = 2 * denominator
+        double_numerator = 2 * numerator
         while numerator_accumulator > 0:
             output += numerator_accumulator
-            numerator_accumulator = (numerator_accumulator * numerator) // (denominator * i)
-            i += 1
+            numerator_accumulator = (numerator_accumulator * numerator) // denominator_i
+            denominator_i += denominator
+            # Once each term is at most half the previous one, the remaining terms add
+            # up to less than twice the current one, so stop as soon as they can no
+            # longer change the result of the final floor division.
+            if (
+                numerator_accumulator < denominator
+                and double_numerator <= denominator_i
+                and (output % denominator) + 2 * numerator_accumulator < denominator
+            ):
+                break
         return output // denominator
 
     @classmethod
@@ -97,10 +114,9 @@ class Spec:
         Calculate the excess blob gas for a block given the excess blob gas
         and blob gas used from the parent block header.
         """
-        if parent.excess_blob_gas + parent.blob_gas_used < cls.TARGET_BLOB_GAS_PER_BLOCK:
-            return 0
-        else:
-            return parent.excess_blob_gas + parent.blob_gas_used - cls.TARGET_BLOB_GAS_PER_BLOCK
+        return max(
+            0, parent.excess_blob_gas + parent.blob_gas_used - cls.TARGET_BLOB_GAS_PER_BLOCK
+        )
 
     # Note: Currently unused.
     # @classmethod
@@ -108,9 +124,10 @@ class Spec:
     #     """
     #     Calculate the total blob gas for a transaction.
     #     """
-    #     if tx.blob_versioned_hashes is None:
+    #     blob_versioned_hashes = tx.blob_versioned_hashes
+    #     if not blob_versioned_hashes:
     #         return 0
-    #     return cls.GAS_PER_BLOB * len(tx.blob_versioned_hashes)
+    #     return cls.GAS_PER_BLOB * len(blob_versioned_hashes)
 
     @classmethod
     def get_blob_gasprice(cls, *, excess_blob_gas: int) -> int:
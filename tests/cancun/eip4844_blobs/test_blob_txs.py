@@ -34,6 +34,7 @@ from ethereum_test_tools import (
     to_hash_bytes,
 )
 
+from .common import sequential_blob_hashes
 from .spec import Spec, SpecHelpers, ref_spec_4844
 
 REFERENCE_SPEC_GIT_PATH = ref_spec_4844.git_path
@@ -159,13 +160,7 @@ def blob_hashes_per_tx(blobs_per_tx: List[int]) -> List[List[bytes]]:
 
     Can be overloaded by a test case to provide a custom list of blob hashes.
     """
-    return [
-        add_kzg_version(
-            [to_hash_bytes(x) for x in range(blob_count)],
-            Spec.BLOB_COMMITMENT_VERSION_KZG,
-        )
-        for blob_count in blobs_per_tx
-    ]
+    return [sequential_blob_hashes[:blob_count] for blob_count in blobs_per_tx]
 
 
 @pytest.fixture
@@ -183,14 +178,16 @@ def total_account_minimum_balance(  # noqa: D103
     the transactions in the block of the test.
     """
     total_cost = 0
+    # All transactions share the same gas, value and calldata, so only the blob
+    # data cost differs between them.
+    tx_base_cost = (
+        (tx_gas * (tx_max_fee_per_gas + tx_max_priority_fee_per_gas))
+        + tx_value
+        + eip_2028_transaction_data_cost(tx_calldata)
+    )
     for tx_blob_count in [len(x) for x in blob_hashes_per_tx]:
         data_cost = tx_max_fee_per_blob_gas * Spec.GAS_PER_BLOB * tx_blob_count
-        total_cost += (
-            (tx_gas * (tx_max_fee_per_gas + tx_max_priority_fee_per_gas))
-            + tx_value
-            + eip_2028_transaction_data_cost(tx_calldata)
-            + data_cost
-        )
+        total_cost += tx_base_cost + data_cost
     return total_cost
 
 
@@ -320,18 +317,10 @@ def blocks(
     """
     Prepare the list of blocks for all test cases.
     """
-    header_blob_gas_used = 0
-    if len(txs) > 0:
-        header_blob_gas_used = (
-            sum(
-                [
-                    len(tx.blob_versioned_hashes)
-                    for tx in txs
-                    if tx.blob_versioned_hashes is not None
-                ]
-            )
-            * Spec.GAS_PER_BLOB
-        )
+    header_blob_gas_used = (
+        sum(len(tx.blob_versioned_hashes) for tx in txs if tx.blob_versioned_hashes)
+        * Spec.GAS_PER_BLOB
+    )
     return [
         Block(txs=txs, exception=tx_error, rlp_modifier=Header(blob_gas_used=header_blob_gas_used))
     ]
@@ -251,18 +251,10 @@ def blocks(
     """
     Prepare the list of blocks for all test cases.
     """
-    header_blob_gas_used = 0
-    if len(txs) > 0:
-        header_blob_gas_used = (
-            sum(
-                [
-                    len(tx.blob_versioned_hashes)
-                    for tx in txs
-                    if tx.blob_versioned_hashes is not None
-                ]
-            )
-            * Spec.GAS_PER_BLOB
-        )
+    header_blob_gas_used = (
+        sum(len(tx.blob_versioned_hashes) for tx in txs if tx.blob_versioned_hashes)
+        * Spec.GAS_PER_BLOB
+    )
     return [
         Block(txs=txs, exception=tx_error, rlp_modifier=Header(blob_gas_used=header_blob_gas_used))
     ]
@@ -36,11 +36,10 @@ from ethereum_test_tools import (
     TestAddress,
     TestAddress2,
     Transaction,
-    add_kzg_version,
     to_address,
-    to_hash_bytes,
 )
 
+from .common import sequential_blob_hashes
 from .spec import Spec, SpecHelpers, ref_spec_4844
 
 REFERENCE_SPEC_GIT_PATH = ref_spec_4844.git_path
@@ -211,10 +210,7 @@ def tx(  # noqa: D103
             max_priority_fee_per_gas=0,
             max_fee_per_blob_gas=tx_max_fee_per_blob_gas,
             access_list=[],
-            blob_versioned_hashes=add_kzg_version(
-                [to_hash_bytes(x) for x in range(new_blobs)],
-                Spec.BLOB_COMMITMENT_VERSION_KZG,
-            ),
+            blob_versioned_hashes=sequential_blob_hashes[:new_blobs],
         )
 
 
@@ -283,7 +279,7 @@ def test_correct_excess_blob_gas_calculation(
         post=post,
         blocks=blocks,
         genesis_environment=env,
-        tag=f"expected_excess_blob_gas:{hex(correct_excess_blob_gas)}",
+        tag=f"expected_excess_blob_gas:{correct_excess_blob_gas:#x}",
     )
 
 
@@ -332,7 +328,7 @@ def test_correct_increasing_blob_gas_costs(
         post=post,
         blocks=blocks,
         genesis_environment=env,
-        tag=f"expected_excess_blob_gas:{hex(correct_excess_blob_gas)}",
+        tag=f"expected_excess_blob_gas:{correct_excess_blob_gas:#x}",
     )
 
 
@@ -361,7 +357,7 @@ def test_correct_decreasing_blob_gas_costs(
         post=post,
         blocks=blocks,
         genesis_environment=env,
-        tag=f"expected_excess_blob_gas:{hex(correct_excess_blob_gas)}",
+        tag=f"expected_excess_blob_gas:{correct_excess_blob_gas:#x}",
     )
 
 
@@ -392,12 +388,7 @@ def test_invalid_zero_excess_blob_gas_in_header(
         post={},
         blocks=blocks,
         genesis_environment=env,
-        tag="-".join(
-            [
-                f"correct:{hex(correct_excess_blob_gas)}",
-                f"header:{hex(header_excess_blob_gas)}",
-            ]
-        ),
+        tag=f"correct:{correct_excess_blob_gas:#x}-header:{header_excess_blob_gas:#x}",
     )
 
 
@@ -438,12 +429,7 @@ def test_invalid_blob_gas_used_in_header(
         post={},
         blocks=blocks,
         genesis_environment=env,
-        tag="-".join(
-            [
-                f"correct:{hex(new_blobs *Spec.GAS_PER_BLOB)}",
-                f"header:{hex(header_blob_gas_used)}",
-            ]
-        ),
+        tag=f"correct:{new_blobs * Spec.GAS_PER_BLOB:#x}-header:{header_blob_gas_used:#x}",
     )
 
 
@@ -481,12 +467,7 @@ def test_invalid_excess_blob_gas_above_target_change(
         post={},
         blocks=blocks,
         genesis_environment=env,
-        tag="-".join(
-            [
-                f"correct:{hex(correct_excess_blob_gas)}",
-                f"header:{hex(header_excess_blob_gas)}",
-            ]
-        ),
+        tag=f"correct:{correct_excess_blob_gas:#x}-header:{header_excess_blob_gas:#x}",
     )
 
 
@@ -521,12 +502,7 @@ def test_invalid_static_excess_blob_gas(
         post={},
         blocks=blocks,
         genesis_environment=env,
-        tag="-".join(
-            [
-                f"correct:{hex(correct_excess_blob_gas)}",
-                f"header:{hex(parent_excess_blob_gas)}",
-            ]
-        ),
+        tag=f"correct:{correct_excess_blob_gas:#x}-header:{parent_excess_blob_gas:#x}",
     )
 
 
@@ -559,12 +535,7 @@ def test_invalid_excess_blob_gas_target_blobs_increase_from_zero(
         post={},
         blocks=blocks,
         genesis_environment=env,
-        tag="-".join(
-            [
-                f"correct:{hex(correct_excess_blob_gas)}",
-                f"header:{hex(header_excess_blob_gas)}",
-            ]
-        ),
+        tag=f"correct:{correct_excess_blob_gas:#x}-header:{header_excess_blob_gas:#x}",
     )
 
 
@@ -600,12 +571,7 @@ def test_invalid_static_excess_blob_gas_from_zero_on_blobs_above_target(
         post={},
         blocks=blocks,
         genesis_environment=env,
-        tag="-".join(
-            [
-                f"correct:{hex(correct_excess_blob_gas)}",
-                f"header:{hex(header_excess_blob_gas)}",
-            ]
-        ),
+        tag=f"correct:{correct_excess_blob_gas:#x}-header:{header_excess_blob_gas:#x}",
     )
 
 
@@ -652,12 +618,7 @@ def test_invalid_excess_blob_gas_change(
         post={},
         blocks=blocks,
         genesis_environment=env,
-        tag="-".join(
-            [
-                f"correct:{hex(correct_excess_blob_gas)}",
-                f"header:{hex(header_excess_blob_gas)}",
-            ]
-        ),
+        tag=f"correct:{correct_excess_blob_gas:#x}-header:{header_excess_blob_gas:#x}",
     )
 
 
@@ -694,12 +655,7 @@ def test_invalid_negative_excess_blob_gas(
         post={},
         blocks=blocks,
         genesis_environment=env,
-        tag="-".join(
-            [
-                f"correct:{hex(correct_excess_blob_gas)}",
-                f"header:{hex(header_excess_blob_gas)}",
-            ]
-        ),
+        tag=f"correct:{correct_excess_blob_gas:#x}-header:{header_excess_blob_gas:#x}",
     )
 
 
@@ -740,10 +696,5 @@ def test_invalid_non_multiple_excess_blob_gas(
         post={},
         blocks=blocks,
         genesis_environment=env,
-        tag="-".join(
-            [
-                f"correct:{hex(correct_excess_blob_gas)}",
-                f"header:{hex(header_excess_blob_gas)}",
-            ]
-        ),
+        tag=f"correct:{correct_excess_blob_gas:#x}-header:{header_excess_blob_gas:#x}",
     )
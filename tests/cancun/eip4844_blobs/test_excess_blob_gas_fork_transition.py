@@ -16,11 +16,10 @@ from ethereum_test_tools import (
     Header,
     TestAddress,
     Transaction,
-    add_kzg_version,
     to_address,
-    to_hash_bytes,
 )
 
+from .common import sequential_blob_hashes
 from .spec import Spec, SpecHelpers, ref_spec_4844
 
 REFERENCE_SPEC_GIT_PATH = ref_spec_4844.git_path
@@ -85,40 +84,35 @@ def post_fork_blocks(
 ):
     """
     Generates blocks past the fork.
+
+    All blocks contain the same transaction, only the nonce is increased on each block.
     """
-    return [
-        Block(
-            txs=[
-                Transaction(
-                    ty=Spec.BLOB_TX_TYPE,
-                    nonce=b,
-                    to=destination_account,
-                    value=1,
-                    gas_limit=3000000,
-                    max_fee_per_gas=1000000,
-                    max_priority_fee_per_gas=10,
-                    max_fee_per_blob_gas=100,
-                    access_list=[],
-                    blob_versioned_hashes=add_kzg_version(
-                        [to_hash_bytes(x) for x in range(blob_count_per_block)],
-                        Spec.BLOB_COMMITMENT_VERSION_KZG,
-                    ),
-                )
-                if blob_count_per_block > 0
-                else Transaction(
-                    ty=2,
-                    nonce=b,
-                    to=destination_account,
-                    value=1,
-                    gas_limit=3000000,
-                    max_fee_per_gas=1000000,
-                    max_priority_fee_per_gas=10,
-                    access_list=[],
-                )
-            ],
+    tx = (
+        Transaction(
+            ty=Spec.BLOB_TX_TYPE,
+            nonce=0,
+            to=destination_account,
+            value=1,
+            gas_limit=3000000,
+            max_fee_per_gas=1000000,
+            max_priority_fee_per_gas=10,
+            max_fee_per_blob_gas=100,
+            access_list=[],
+            blob_versioned_hashes=sequential_blob_hashes[:blob_count_per_block],
+        )
+        if blob_count_per_block > 0
+        else Transaction(
+            ty=2,
+            nonce=0,
+            to=destination_account,
+            value=1,
+            gas_limit=3000000,
+            max_fee_per_gas=1000000,
+            max_priority_fee_per_gas=10,
+            access_list=[],
         )
-        for b in range(post_fork_block_count)
-    ]
+    )
+    return [Block(txs=[tx.with_nonce(b)]) for b in range(post_fork_block_count)]
 
 
 @pytest.fixture